@@ -3,10 +3,19 @@ import json
 from vercel import create_streaming_processor, TextDeltaChunk, sse_stream_to_message
 from vercel import TextStartChunk
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if __name__ == "__main__":
     with open('./example-stream-data.txt') as f:
         sse_data = f.read()
     message, processor = sse_stream_to_message(sse_data)
-    with open('./result.json', 'w') as f:
-        f.write(json.dumps(message.to_dict(), indent=2))
+    if orjson is not None:
+        with open('./result.json', 'wb') as f:
+            f.write(orjson.dumps(message.to_dict(), option=orjson.OPT_INDENT_2))
+    else:
+        with open('./result.json', 'w', encoding='utf-8') as f:
+            json.dump(message.to_dict(), f, indent=2)
 
@@ -1,18 +1,37 @@
+import json
 import uuid
 
 import requests
 
 from vercel import UIMessage, SSEParser, UIMessageStreamProcessor
-from vercel.UIMessage import TextUIPart
+from vercel.UIMessage import BaseUIPart, TextUIPart
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def stream_text(
-        provider: str,
+# Only needed by astream_text
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _json_default(obj):
+    if isinstance(obj, (UIMessage, BaseUIPart)):
+        return obj.to_dict()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _encode_request_body(
         model: str,
         messages: list[UIMessage],
         prompt: str,
-        **kwargs
-):
+        kwargs: dict
+) -> bytes:
     request_messages = list()
     request_messages.extend(messages)
     request_messages.append(UIMessage(
@@ -20,13 +39,33 @@ def stream_text(
         role='user',
         parts=[TextUIPart(text=prompt)],
     ))
+    body = {
+        'model': model,
+        'messages': request_messages,
+        **kwargs
+    }
+    # Messages are converted while encoding, in a single pass over the tree
+    if orjson is not None:
+        # Non-str keys are stringified, as the stdlib encoder does
+        return orjson.dumps(
+            body,
+            default=_json_default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(body, default=_json_default).encode('utf-8')
+
+
+def stream_text(
+        provider: str,
+        model: str,
+        messages: list[UIMessage],
+        prompt: str,
+        **kwargs
+):
     response = requests.post(
         f'http://localhost:3000/v1/llm/{provider}/chat',
-        json={
-            'model': model,
-            'messages': list(map(lambda m: m.to_dict(), request_messages)),
-            **kwargs
-        },
+        data=_encode_request_body(model, messages, prompt, kwargs),
+        headers=_JSON_HEADERS,
         stream=True
     )
 
@@ -36,6 +75,46 @@ def stream_text(
     return StreamTextResponse(response)
 
 
+async def astream_text(
+        provider: str,
+        model: str,
+        messages: list[UIMessage],
+        prompt: str,
+        **kwargs
+):
+    """
+    Async variant of stream_text, so many streams can share one event loop.
+
+    The returned response must be read to the end or closed with aclose(),
+    or used as an async context manager.
+    """
+    if httpx is None:
+        raise ImportError('astream_text requires httpx')
+
+    client = httpx.AsyncClient(timeout=None)
+    try:
+        request = client.build_request(
+            'POST',
+            f'http://localhost:3000/v1/llm/{provider}/chat',
+            content=_encode_request_body(model, messages, prompt, kwargs),
+            headers=_JSON_HEADERS,
+        )
+        response = await client.send(request, stream=True)
+    except BaseException:
+        await client.aclose()
+        raise
+
+    if not response.is_success:
+        try:
+            await response.aread()
+            raise BaseException(response.text)
+        finally:
+            await response.aclose()
+            await client.aclose()
+
+    return AsyncStreamTextResponse(client, response)
+
+
 class StreamTextResponse:
     stream_id: str | None = None
     response: requests.Response
@@ -47,13 +126,8 @@ class StreamTextResponse:
     def read_chunks(self):
         sse_parser = SSEParser()
 
-        for line in self.response.iter_lines(delimiter=b'\n\n'):
-            if line == b'':
-                continue
-            event = sse_parser.parse_sse_line(line.decode('utf-8'))
-            if event.data == '[DONE]':
-                break
-            # print(event.data)
+        # Reads may end mid-line; the parser buffers them until events are complete
+        for chunk in sse_parser.parse_sse_bytes(self.response.iter_content(chunk_size=65536)):
             # Example:
             # {"type": "start", "messageId": "2b50779c-5e07-4d00-bd9b-efa49971ae26"}
             # {"type": "start-step"}
@@ -68,11 +142,48 @@ class StreamTextResponse:
             # {"type": "text-end", "id": "0"}
             # {"type": "finish-step"}
             # {"type": "finish"}
-            chunk = sse_parser.parse_chunk_json(event.data)
             yield chunk
 
     def read_message(self):
         processor = UIMessageStreamProcessor()
-        for chunk in self.read_chunks():
+        processor.process_chunks(self.read_chunks())
+        return processor.build_message()
+
+
+class AsyncStreamTextResponse:
+    stream_id: str | None = None
+    response: 'httpx.Response'
+
+    def __init__(self, client: 'httpx.AsyncClient', response: 'httpx.Response'):
+        self.stream_id = response.headers.get('X-AI-Proxy-Stream-Id')
+        self.client = client
+        self.response = response
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the response and its client; safe to call more than once."""
+        try:
+            await self.response.aclose()
+        finally:
+            await self.client.aclose()
+
+    async def read_chunks(self):
+        sse_parser = SSEParser()
+
+        try:
+            # Without a chunk_size, aiter_bytes hands over reads as they arrive
+            async for chunk in sse_parser.aparse_sse_bytes(self.response.aiter_bytes()):
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def read_message(self):
+        processor = UIMessageStreamProcessor()
+        async for chunk in self.read_chunks():
             processor.process_chunk(chunk)
         return processor.build_message()
@@ -0,0 +1,23 @@
+from setuptools import setup
+
+# The streaming hot paths are compiled with Cython when it is available.
+# The modules stay plain Python, so installs without Cython (or on PyPy)
+# fall back to the pure-Python implementation.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ['vercel/sse_parser.py', 'vercel/stream_processor.py'],
+        language_level=3,
+        # Annotations document the API and must not turn into runtime type
+        # checks; the types the compiled build relies on are in the .pxd files
+        compiler_directives={'annotation_typing': False},
+    )
+
+setup(
+    name='vercel-ai-py',
+    packages=['vercel', 'ai_stream_proxy'],
+    ext_modules=ext_modules,
+)
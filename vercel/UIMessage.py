@@ -8,9 +8,9 @@ The UIMessage structure represents AI conversation messages with rich metadata a
 support for various message parts including text, tools, files, and more.
 """
 
-from typing import Any, Dict, List, Literal, Optional, Union, TypeVar, Generic
-from dataclasses import dataclass, asdict
-from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Literal, Optional, Union, TypeVar, Generic, get_args, get_origin
+from dataclasses import dataclass, field, fields
+from abc import ABC
 
 # Type aliases
 UIDataTypes = Dict[str, Any]
@@ -32,51 +32,82 @@ StreamingState = Literal['streaming', 'done']
 ToolState = Literal['input-streaming', 'input-available', 'output-available', 'output-error']
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseUIPart(ABC):
     """Base class for all UI message parts."""
 
-    @property
-    @abstractmethod
-    def type(self) -> str:
-        """Return the type identifier for this part."""
-        pass
+    # Type identifier for this part, stored as a plain attribute so reads are cheap
+    type: str = field(init=False, default='')
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the part to a dictionary for JSON serialization."""
-        result = asdict(self)
-        result['type'] = self.type
-        # Remove None/null values
-        return {k: v for k, v in result.items() if v is not None}
+        # Read fields directly instead of using asdict(), which deep-copies every value
+        result = {}
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            # Skip None/null values
+            if value is not None:
+                result[name] = value
+        return result
 
 
-@dataclass
+def _is_nullable(annotation: Any) -> bool:
+    """Return True if a field annotated with annotation may hold None."""
+    return annotation is Any or (
+        get_origin(annotation) is Union and type(None) in get_args(annotation)
+    )
+
+
+def _fast_to_dict(cls):
+    """
+    Replace the generic to_dict of a part class with one generated for its fields.
+    
+    The generated method reads each field once, and only fields that may be
+    None are guarded by a None check.
+    """
+    lines = ['def to_dict(self):', '    result = {}']
+    for f in fields(cls):
+        if _is_nullable(f.type):
+            lines.append(f'    value = self.{f.name}')
+            lines.append('    if value is not None:')
+            lines.append(f'        result[{f.name!r}] = value')
+        else:
+            lines.append(f'    result[{f.name!r}] = self.{f.name}')
+    lines.append('    return result')
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = f'{cls.__qualname__}.to_dict'
+    to_dict.__doc__ = BaseUIPart.to_dict.__doc__
+    cls.to_dict = to_dict
+    return cls
+
+
+@_fast_to_dict
+@dataclass(slots=True)
 class TextUIPart(BaseUIPart):
     """Text content part of a UI message."""
+    type: str = field(init=False, default='text')
     text: str
     state: Optional[StreamingState] = None
     providerMetadata: Optional[ProviderMetadata] = None
 
-    @property
-    def type(self) -> str:
-        return 'text'
-
 
-@dataclass
+@_fast_to_dict
+@dataclass(slots=True)
 class ReasoningUIPart(BaseUIPart):
     """Reasoning content part showing AI's thought process."""
+    type: str = field(init=False, default='reasoning')
     text: str
     state: Optional[StreamingState] = None
     providerMetadata: Optional[ProviderMetadata] = None
 
-    @property
-    def type(self) -> str:
-        return 'reasoning'
-
 
-@dataclass
+@_fast_to_dict
+@dataclass(slots=True)
 class ToolUIPart(BaseUIPart):
     """Tool usage part of a UI message."""
+    type: str = field(init=False, default='')
     toolCallId: str
     toolName: str
     state: ToolState
@@ -84,14 +115,15 @@ class ToolUIPart(BaseUIPart):
     result: Optional[Any] = None
     providerMetadata: Optional[ProviderMetadata] = None
 
-    @property
-    def type(self) -> str:
-        return f'tool-{self.toolName}'
+    def __post_init__(self):
+        self.type = f'tool-{self.toolName}'
 
 
-@dataclass
+@_fast_to_dict
+@dataclass(slots=True)
 class DynamicToolUIPart(BaseUIPart):
     """Dynamic tool usage part with runtime-determined behavior."""
+    type: str = field(init=False, default='dynamic-tool')
     toolCallId: str
     toolName: str
     state: ToolState
@@ -101,68 +133,54 @@ class DynamicToolUIPart(BaseUIPart):
     callProviderMetadata: Optional[ProviderMetadata] = None
     preliminary: Optional[bool] = None
 
-    @property
-    def type(self) -> str:
-        return 'dynamic-tool'
-
 
-@dataclass
+@_fast_to_dict
+@dataclass(slots=True)
 class SourceUrlUIPart(BaseUIPart):
     """Source URL reference part."""
+    type: str = field(init=False, default='source-url')
     sourceId: str
     url: str
     title: Optional[str] = None
     providerMetadata: Optional[ProviderMetadata] = None
 
-    @property
-    def type(self) -> str:
-        return 'source-url'
 
-
-@dataclass
+@_fast_to_dict
+@dataclass(slots=True)
 class SourceDocumentUIPart(BaseUIPart):
     """Source document reference part."""
+    type: str = field(init=False, default='source-document')
     sourceId: str
     title: Optional[str] = None
     content: Optional[str] = None
     providerMetadata: Optional[ProviderMetadata] = None
 
-    @property
-    def type(self) -> str:
-        return 'source-document'
-
 
-@dataclass
+@_fast_to_dict
+@dataclass(slots=True)
 class FileUIPart(BaseUIPart):
     """File attachment part."""
+    type: str = field(init=False, default='file')
     mediaType: str
     filename: Optional[str] = None
     url: str = ""
     providerMetadata: Optional[ProviderMetadata] = None
 
-    @property
-    def type(self) -> str:
-        return 'file'
-
 
-@dataclass
+@_fast_to_dict
+@dataclass(slots=True)
 class DataUIPart(BaseUIPart):
     """Generic data part for custom data types."""
+    type: str = field(init=False, default='data')
     data: Any
     providerMetadata: Optional[ProviderMetadata] = None
 
-    @property
-    def type(self) -> str:
-        return 'data'
 
-
-@dataclass
+@_fast_to_dict
+@dataclass(slots=True)
 class StepStartUIPart(BaseUIPart):
     """Step start marker for multi-step processes."""
-
-    @property
-    def type(self) -> str:
-        return 'step-start'
+    type: str = field(init=False, default='step-start')
 
 
 # Union type for all possible UI message parts
@@ -216,7 +234,7 @@ class UIMessage(Generic[METADATA, DATA_PARTS, TOOLS]):
         Return the text part of the message.
         :return:
         """
-        return ''.join(map(lambda part: part.text if isinstance(part, TextUIPart) else '', self.parts))
+        return ''.join([part.text for part in self.parts if part.__class__ is TextUIPart])
 
 
 # Utility functions for working with UI message parts
@@ -21,7 +21,7 @@ METADATA = TypeVar('METADATA')
 DATA_TYPES = TypeVar('DATA_TYPES', bound=UIDataTypes)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextStartChunk:
     """Chunk indicating the start of text generation."""
     type: Literal['text-start'] = 'text-start'
@@ -29,7 +29,7 @@ class TextStartChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TextDeltaChunk:
     """Chunk containing incremental text content."""
     type: Literal['text-delta'] = 'text-delta'
@@ -38,7 +38,7 @@ class TextDeltaChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TextEndChunk:
     """Chunk indicating the end of text generation."""
     type: Literal['text-end'] = 'text-end'
@@ -46,14 +46,14 @@ class TextEndChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorChunk:
     """Chunk representing an error condition."""
     type: Literal['error'] = 'error'
     errorText: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInputStartChunk:
     """Chunk indicating tool input generation started."""
     type: Literal['tool-input-start'] = 'tool-input-start'
@@ -63,7 +63,7 @@ class ToolInputStartChunk:
     dynamic: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInputDeltaChunk:
     """Chunk containing incremental tool input text."""
     type: Literal['tool-input-delta'] = 'tool-input-delta'
@@ -71,7 +71,7 @@ class ToolInputDeltaChunk:
     inputTextDelta: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInputAvailableChunk:
     """Chunk indicating tool input is available."""
     type: Literal['tool-input-available'] = 'tool-input-available'
@@ -83,7 +83,7 @@ class ToolInputAvailableChunk:
     dynamic: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInputErrorChunk:
     """Chunk indicating tool input generation error."""
     type: Literal['tool-input-error'] = 'tool-input-error'
@@ -96,7 +96,7 @@ class ToolInputErrorChunk:
     dynamic: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolOutputAvailableChunk:
     """Chunk indicating tool output is available."""
     type: Literal['tool-output-available'] = 'tool-output-available'
@@ -107,7 +107,7 @@ class ToolOutputAvailableChunk:
     preliminary: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolOutputErrorChunk:
     """Chunk indicating tool output error."""
     type: Literal['tool-output-error'] = 'tool-output-error'
@@ -120,7 +120,7 @@ class ToolOutputErrorChunk:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningStartChunk:
     """Chunk indicating start of reasoning generation."""
     type: Literal['reasoning-start'] = 'reasoning-start'
@@ -128,7 +128,7 @@ class ReasoningStartChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningDeltaChunk:
     """Chunk containing incremental reasoning content."""
     type: Literal['reasoning-delta'] = 'reasoning-delta'
@@ -137,7 +137,7 @@ class ReasoningDeltaChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningEndChunk:
     """Chunk indicating end of reasoning generation."""
     type: Literal['reasoning-end'] = 'reasoning-end'
@@ -145,7 +145,7 @@ class ReasoningEndChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceUrlChunk:
     """Chunk containing source URL information."""
     type: Literal['source-url'] = 'source-url'
@@ -154,7 +154,7 @@ class SourceUrlChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceDocumentChunk:
     """Chunk containing source document information."""
     type: Literal['source-document'] = 'source-document'
@@ -164,7 +164,7 @@ class SourceDocumentChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChunk:
     """Chunk containing file attachment information."""
     type: Literal['file'] = 'file'
@@ -175,26 +175,26 @@ class FileChunk:
     providerMetadata: Optional[ProviderMetadata] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StepStartChunk:
     """Chunk indicating start of a process step."""
     type: Literal['start-step'] = 'start-step'
 
 
-@dataclass
+@dataclass(slots=True)
 class StepFinishChunk:
     """Chunk indicating finish of a process step."""
     type: Literal['finish-step'] = 'finish-step'
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageMetadataChunk(Generic[METADATA]):
     """Chunk containing message metadata."""
     type: Literal['message-metadata'] = 'message-metadata'
     metadata: METADATA = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DataChunk(Generic[DATA_TYPES]):
     """Chunk containing custom data."""
     type: str  # Will be 'data-{type}' format
@@ -208,7 +208,7 @@ class DataChunk(Generic[DATA_TYPES]):
 
 
 # Add missing control chunks
-@dataclass
+@dataclass(slots=True)
 class StartChunk:
     """Chunk indicating start of message generation."""
     type: Literal['start'] = 'start'
@@ -216,14 +216,14 @@ class StartChunk:
     messageMetadata: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FinishChunk:
     """Chunk indicating finish of message generation."""
     type: Literal['finish'] = 'finish'
     messageMetadata: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AbortChunk:
     """Chunk indicating message generation was aborted."""
     type: Literal['abort'] = 'abort'
@@ -258,6 +258,17 @@ UIMessageChunk = Union[
 ]
 
 
+# Chunk type groups used by the is_*_chunk helpers
+_TEXT_CHUNK_TYPES = frozenset({'text-start', 'text-delta', 'text-end'})
+_TOOL_CHUNK_TYPES = frozenset({
+    'tool-input-start', 'tool-input-delta', 'tool-input-available',
+    'tool-input-error', 'tool-output-available', 'tool-output-error'
+})
+_REASONING_CHUNK_TYPES = frozenset({'reasoning-start', 'reasoning-delta', 'reasoning-end'})
+_STEP_CHUNK_TYPES = frozenset({'start-step', 'finish-step'})
+_SOURCE_CHUNK_TYPES = frozenset({'source-url', 'source-document'})
+
+
 # Utility functions for working with UI message chunks
 
 def is_text_chunk(chunk: UIMessageChunk) -> bool:
@@ -270,7 +281,7 @@ def is_text_chunk(chunk: UIMessageChunk) -> bool:
     Returns:
         True if the chunk is text-related, False otherwise
     """
-    return chunk.type in ['text-start', 'text-delta', 'text-end']
+    return chunk.type in _TEXT_CHUNK_TYPES
 
 
 def is_tool_chunk(chunk: UIMessageChunk) -> bool:
@@ -283,10 +294,7 @@ def is_tool_chunk(chunk: UIMessageChunk) -> bool:
     Returns:
         True if the chunk is tool-related, False otherwise
     """
-    return chunk.type in [
-        'tool-input-start', 'tool-input-delta', 'tool-input-available', 
-        'tool-input-error', 'tool-output-available', 'tool-output-error'
-    ]
+    return chunk.type in _TOOL_CHUNK_TYPES
 
 
 def is_reasoning_chunk(chunk: UIMessageChunk) -> bool:
@@ -299,7 +307,7 @@ def is_reasoning_chunk(chunk: UIMessageChunk) -> bool:
     Returns:
         True if the chunk is reasoning-related, False otherwise
     """
-    return chunk.type in ['reasoning-start', 'reasoning-delta', 'reasoning-end']
+    return chunk.type in _REASONING_CHUNK_TYPES
 
 
 def is_data_chunk(chunk: UIMessageChunk) -> bool:
@@ -325,7 +333,7 @@ def is_step_chunk(chunk: UIMessageChunk) -> bool:
     Returns:
         True if the chunk is step-related, False otherwise
     """
-    return chunk.type in ['start-step', 'finish-step']
+    return chunk.type in _STEP_CHUNK_TYPES
 
 
 def is_source_chunk(chunk: UIMessageChunk) -> bool:
@@ -338,7 +346,7 @@ def is_source_chunk(chunk: UIMessageChunk) -> bool:
     Returns:
         True if the chunk is source-related, False otherwise
     """
-    return chunk.type in ['source-url', 'source-document']
+    return chunk.type in _SOURCE_CHUNK_TYPES
 
 
 def get_chunk_id(chunk: UIMessageChunk) -> Optional[str]:
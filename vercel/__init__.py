@@ -1,7 +1,108 @@
-from .UIMessageChunk import *
-from .sse_parser import *
-from .stream_integration import *
-from .stream_processor import *
+import importlib
+
+# These names collide with their submodules. Importing a submodule binds it as
+# a package attribute, which would hide a lazily resolved name, so the two core
+# type modules are imported eagerly.
+from .UIMessage import UIMessage
+from .UIMessageChunk import UIMessageChunk
+
+# Public names mapped to the submodule defining them. Submodules are imported
+# on first attribute access (PEP 562), so importing the package stays cheap.
+_LAZY = {
+    # Chunk types
+    'UIDataTypes': '.UIMessageChunk',
+    'ProviderMetadata': '.UIMessageChunk',
+    'METADATA': '.UIMessageChunk',
+    'DATA_TYPES': '.UIMessageChunk',
+    'TextStartChunk': '.UIMessageChunk',
+    'TextDeltaChunk': '.UIMessageChunk',
+    'TextEndChunk': '.UIMessageChunk',
+    'ErrorChunk': '.UIMessageChunk',
+    'ToolInputStartChunk': '.UIMessageChunk',
+    'ToolInputDeltaChunk': '.UIMessageChunk',
+    'ToolInputAvailableChunk': '.UIMessageChunk',
+    'ToolInputErrorChunk': '.UIMessageChunk',
+    'ToolOutputAvailableChunk': '.UIMessageChunk',
+    'ToolOutputErrorChunk': '.UIMessageChunk',
+    'ReasoningStartChunk': '.UIMessageChunk',
+    'ReasoningDeltaChunk': '.UIMessageChunk',
+    'ReasoningEndChunk': '.UIMessageChunk',
+    'SourceUrlChunk': '.UIMessageChunk',
+    'SourceDocumentChunk': '.UIMessageChunk',
+    'FileChunk': '.UIMessageChunk',
+    'StepStartChunk': '.UIMessageChunk',
+    'StepFinishChunk': '.UIMessageChunk',
+    'MessageMetadataChunk': '.UIMessageChunk',
+    'DataChunk': '.UIMessageChunk',
+    'StartChunk': '.UIMessageChunk',
+    'FinishChunk': '.UIMessageChunk',
+    'AbortChunk': '.UIMessageChunk',
+    'is_text_chunk': '.UIMessageChunk',
+    'is_tool_chunk': '.UIMessageChunk',
+    'is_reasoning_chunk': '.UIMessageChunk',
+    'is_data_chunk': '.UIMessageChunk',
+    'is_step_chunk': '.UIMessageChunk',
+    'is_source_chunk': '.UIMessageChunk',
+    'get_chunk_id': '.UIMessageChunk',
+    'get_provider_metadata': '.UIMessageChunk',
+    'create_text_delta_chunk': '.UIMessageChunk',
+    'create_tool_input_chunk': '.UIMessageChunk',
+    'create_error_chunk': '.UIMessageChunk',
+    'create_data_chunk': '.UIMessageChunk',
+
+    # Message types
+    'Role': '.UIMessage',
+    'ToolState': '.UIMessage',
+    'TextUIPart': '.UIMessage',
+    'ReasoningUIPart': '.UIMessage',
+    'ToolUIPart': '.UIMessage',
+    'DynamicToolUIPart': '.UIMessage',
+    'SourceUrlUIPart': '.UIMessage',
+    'SourceDocumentUIPart': '.UIMessage',
+    'FileUIPart': '.UIMessage',
+    'DataUIPart': '.UIMessage',
+    'StepStartUIPart': '.UIMessage',
+
+    # Stream processing
+    'ToolCall': '.stream_processor',
+    'StreamState': '.stream_processor',
+    'UIMessageStreamProcessor': '.stream_processor',
+    'StreamBuffer': '.stream_processor',
+    'process_chunk_stream': '.stream_processor',
+    'create_streaming_processor': '.stream_processor',
+
+    # SSE parsing
+    'SSEParseError': '.sse_parser',
+    'SSEEvent': '.sse_parser',
+    'SSEParser': '.sse_parser',
+    'parse_sse_to_chunks': '.sse_parser',
+
+    # Integration
+    'SSEStreamProcessor': '.stream_integration',
+    'sse_stream_to_message': '.stream_integration',
+}
+
+
+# Submodules that the eager imports used to bind as package attributes
+_SUBMODULES = ('sse_parser', 'stream_processor', 'stream_integration')
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # Importing a submodule also binds it on the package
+        return importlib.import_module(f'.{name}', __name__)
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
+
 
 # Make all classes and functions available at module level
 __all__ = [
@@ -0,0 +1,17 @@
+# Augmenting declarations for vercel/sse_parser.py, used only when setup.py
+# compiles the module with Cython. The .py source stays the pure-Python
+# fallback and must keep the same attributes and method signatures.
+
+cdef class SSEParser:
+    cdef public object chunk_factory
+    cdef public bytearray buffer
+    cdef dict _chunk_factories
+    cdef Py_ssize_t _offset
+    cdef Py_ssize_t _search_from
+    cdef bint _after_cr
+    cdef object _simd_parser
+
+    cpdef parse_sse_line(self, line)
+    cpdef parse_chunk_json(self, json_data)
+    cpdef decode_chunk_json(self, json_data)
+    cpdef chunk_from_dict(self, data)
@@ -1,3 +1,4 @@
+# cython: boundscheck=False, wraparound=False
 """
 SSE (Server-Sent Events) parsing functionality for UIMessageChunk streams.
 
@@ -5,9 +6,26 @@ This module provides utilities for parsing raw SSE streams and converting them
 to UIMessageChunk objects for further processing.
 """
 
-from typing import Dict, List, Optional, Iterator, Union
-from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Iterable, Iterator, Union
+from dataclasses import MISSING, dataclass, fields
+from itertools import chain
 import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 from .UIMessageChunk import (
     UIMessageChunk, TextStartChunk, TextDeltaChunk, TextEndChunk,
@@ -19,16 +37,99 @@ from .UIMessageChunk import (
     StartChunk, FinishChunk, AbortChunk
 )
 
+# Scanner for 'data' field lines. Other fields (event, id, retry) and comments
+# are not used, so a single compiled pattern classifies and extracts in C.
+_DATA_FIELD = re.compile(rb'^data: ?([^\r\n]*)', re.MULTILINE)
+
+# orjson accepts both str and bytes and is considerably faster than the stdlib.
+# msgspec's untyped decoder is a comparable fallback; its DecodeError is a
+# ValueError like those of the other decoders.
+if orjson is not None:
+    _json_loads = orjson.loads
+elif msgspec is not None:
+    _json_loads = msgspec.json.Decoder().decode
+else:
+    _json_loads = json.loads
+
+# Map chunk types to their corresponding classes
+_CHUNK_CLASSES = {
+    'text-start': TextStartChunk,
+    'text-delta': TextDeltaChunk,
+    'text-end': TextEndChunk,
+    'reasoning-start': ReasoningStartChunk,
+    'reasoning-delta': ReasoningDeltaChunk,
+    'reasoning-end': ReasoningEndChunk,
+    'tool-input-start': ToolInputStartChunk,
+    'tool-input-delta': ToolInputDeltaChunk,
+    'tool-input-available': ToolInputAvailableChunk,
+    'tool-input-error': ToolInputErrorChunk,
+    'tool-output-available': ToolOutputAvailableChunk,
+    'tool-output-error': ToolOutputErrorChunk,
+    'source-url': SourceUrlChunk,
+    'source-document': SourceDocumentChunk,
+    'file': FileChunk,
+    'start-step': StepStartChunk,
+    'finish-step': StepFinishChunk,
+    'message-metadata': MessageMetadataChunk,
+    'error': ErrorChunk,
+    'start': StartChunk,
+    'finish': FinishChunk,
+    'abort': AbortChunk,
+}
+
+
+def _make_chunk_factory(chunk_class: type) -> Callable[[dict], UIMessageChunk]:
+    """
+    Generate a constructor that builds chunk_class from a decoded JSON object.
+    
+    The generated function reads exactly the dataclass fields by name, so no
+    keyword dict has to be unpacked and unknown keys are ignored. The chunk is
+    allocated with __new__ and its slots assigned directly, skipping __init__
+    argument binding; the built-in chunk classes define no __post_init__.
+    """
+    namespace = {'_cls': chunk_class, '_new': object.__new__}
+    values = []
+    for f in fields(chunk_class):
+        if f.default is not MISSING:
+            namespace[f'_default_{f.name}'] = f.default
+            values.append((f.name, f"data.get({f.name!r}, _default_{f.name})"))
+        else:
+            values.append((f.name, f"data[{f.name!r}]"))
+    name = f'_make_{chunk_class.__name__}'
+    body = ''.join(f"    obj.{field_name} = {value}\n" for field_name, value in values)
+    source = f"def {name}(data):\n    obj = _new(_cls)\n{body}    return obj\n"
+    exec(source, namespace)
+    return namespace[name]
+
+
+def _make_custom_chunk_factory(chunk_class: type) -> Callable[[dict], UIMessageChunk]:
+    """Wrap a custom chunk class, which receives the decoded object as keyword arguments."""
+    def factory(data: dict) -> UIMessageChunk:
+        # Use data directly since Python implementation now matches TypeScript field names
+        return chunk_class(**data)
+    return factory
+
+
+_CHUNK_FACTORIES = {
+    chunk_type: _make_chunk_factory(chunk_class)
+    for chunk_type, chunk_class in _CHUNK_CLASSES.items()
+}
+
 
 class SSEParseError(Exception):
     """Exception raised when SSE parsing fails."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class SSEEvent:
-    """Represents a parsed SSE event."""
-    data: Optional[str] = None
+    """
+    Represents a parsed SSE event.
+    
+    Deprecated: SSEParser now returns the data payload itself and no longer
+    creates SSEEvent objects. The class is kept for compatibility.
+    """
+    data: Optional[Union[str, bytes]] = None
 
 
 class SSEParser:
@@ -47,41 +148,164 @@ class SSEParser:
             chunk_factory: Optional mapping of chunk type names to classes for custom chunks
         """
         self.chunk_factory = chunk_factory or {}
-        self.buffer = ""
+        # Built-in and custom constructors merged once, custom types taking
+        # precedence, so each event needs a single lookup
+        self._chunk_factories = _CHUNK_FACTORIES if not chunk_factory else {
+            **_CHUNK_FACTORIES,
+            **{chunk_type: _make_custom_chunk_factory(chunk_class)
+               for chunk_type, chunk_class in chunk_factory.items()},
+        }
+        self.buffer = bytearray()
+        # Start of unconsumed data in buffer, and where to resume scanning for
+        # the end of the next event
+        self._offset = 0
+        self._search_from = 0
+        # Whether the last read ended with a CR, whose LF may start the next one
+        self._after_cr = False
+        # Without orjson or msgspec, decode with pysimdjson if available. The parser
+        # is reused across events so its internal buffers are allocated only once.
+        self._simd_parser = (
+            simdjson.Parser() if orjson is None and msgspec is None and simdjson is not None else None
+        )
+        
+    @staticmethod
+    def is_done_marker(payload: Union[str, bytes]) -> bool:
+        """
+        Check whether a data payload is the [DONE] marker ending the stream.
         
-    def parse_sse_line(self, line: str) -> Optional[SSEEvent]:
+        The payload is compared with the marker of its own type, so str and
+        bytes are never compared with each other.
+        """
+        if isinstance(payload, str):
+            return payload == '[DONE]'
+        return payload == b'[DONE]'
+    
+    def parse_sse_line(self, line: Union[str, bytes]) -> Optional[Union[str, bytes]]:
         """
         Parse a single SSE line.
         
         Args:
-            line: Raw SSE line
+            line: Raw SSE line, as str or as undecoded bytes
             
         Returns:
-            SSEEvent if the line represents a complete event, None otherwise
+            Stripped value of a 'data' line, of the same type as line (possibly
+            empty), or None for any other line
         """
-        line = line.strip()
+        # Only the 'data' field is used, so a single prefix test classifies the
+        # line; empty lines, comments and other fields all fall through to None.
+        if isinstance(line, str):
+            if line.startswith('data:'):
+                return line[5:].strip()
+        elif line.startswith(b'data:'):
+            # Kept undecoded for the JSON parser
+            return bytes(line[5:].strip())
+        return None
+    
+    def feed(self, data: bytes) -> Iterator[bytes]:
+        """
+        Feed raw bytes from the transport and yield the data of complete SSE events.
+        
+        Bytes are accumulated until a blank line terminates an event, so the
+        transport may split the stream at arbitrary positions. The value of
+        the 'data' field is kept as bytes, which parse_chunk_json accepts
+        without decoding. CRLF and CR line endings are converted to LF as
+        they are buffered.
         
-        # Skip empty lines and comments
-        if not line or line.startswith(':'):
-            return None
+        Args:
+            data: Raw bytes received from the transport
             
-        # Handle field: value format
-        if ':' in line:
-            field, value = line.split(':', 1)
-            field = field.strip()
-            value = value.strip()
-
-            if field == 'data':
-                return SSEEvent(data=value)
-                    
-        return None
+        Yields:
+            Data payload of every complete event carrying a data field
+        """
+        if self._after_cr:
+            self._after_cr = False
+            if data.startswith(b'\n'):
+                # Second half of a CRLF split across reads
+                data = data[1:]
+        if b'\r' in data:
+            self._after_cr = data.endswith(b'\r')
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        buffer = self.buffer
+        buffer += data
+        offset = self._offset
+        search_from = self._search_from
+        try:
+            while True:
+                end = buffer.find(b'\n\n', search_from)
+                if end < 0:
+                    # Resume the next search where this one left off
+                    search_from = max(offset, len(buffer) - 1)
+                    break
+                payload = self._parse_event(offset, end)
+                offset = search_from = end + 2
+                if payload is not None:
+                    yield payload
+        finally:
+            # Consumed events stay in the buffer until they make up most of it,
+            # so the cost of moving the remaining bytes is amortized
+            if offset * 2 > len(buffer):
+                del buffer[:offset]
+                search_from -= offset
+                offset = 0
+            self._offset = offset
+            self._search_from = search_from
     
-    def parse_chunk_json(self, json_data: str) -> Optional[UIMessageChunk]:
+    def flush(self) -> Optional[bytes]:
+        """
+        Return the data of an event left unterminated when the stream ends.
+        
+        The complete lines after the last blank line are parsed as if the
+        event had been terminated; a trailing partial line is discarded. The
+        buffer is reset, so the parser can be fed a new stream.
+        
+        Returns:
+            Data payload of the unterminated event, or None if it has none
+        """
+        offset = self._offset
+        end = self.buffer.rfind(b'\n', offset)
+        payload = self._parse_event(offset, end) if end >= 0 else None
+        self.buffer.clear()
+        self._offset = self._search_from = 0
+        self._after_cr = False
+        return payload
+    
+    def _parse_event(self, start: int, end: int) -> Optional[bytes]:
+        """Return the data of the event stored in buffer[start:end], if it has any."""
+        buffer = self.buffer
+        data = None
+        with memoryview(buffer) as view:
+            for match in _DATA_FIELD.finditer(buffer, start, end):
+                value = bytes(view[match.start(1):match.end(1)])
+                data = value if data is None else b'\n'.join((data, value))
+        return data
+    
+    def _parse_simdjson(self, json_data: Union[str, bytes]):
+        """
+        Decode json_data with the reused simdjson parser.
+        
+        The type tag is probed on the lazily parsed document first, so payloads
+        of an unknown type are rejected without converting the rest. Documents
+        returned by the parser are only valid until its next parse, so the
+        result is fully converted to Python objects before returning.
+        """
+        if isinstance(json_data, str):
+            json_data = json_data.encode('utf-8')
+        document = self._simd_parser.parse(json_data)
+        if not isinstance(document, simdjson.Object):
+            # Rejected by the caller, which only accepts objects
+            return document
+        chunk_type = document.get('type')
+        if (isinstance(chunk_type, str) and chunk_type not in self._chunk_factories
+                and not chunk_type.startswith('data-')):
+            raise SSEParseError(f"Unknown chunk type: {chunk_type}")
+        return document.as_dict()
+    
+    def parse_chunk_json(self, json_data: Union[str, bytes]) -> Optional[UIMessageChunk]:
         """
         Parse JSON data into a UIMessageChunk.
         
         Args:
-            json_data: JSON string representing chunk data
+            json_data: JSON string or bytes representing chunk data
             
         Returns:
             UIMessageChunk object or None if parsing fails
@@ -89,45 +313,48 @@ class SSEParser:
         Raises:
             SSEParseError: If JSON is malformed or chunk type is unknown
         """
+        return self.chunk_from_dict(self.decode_chunk_json(json_data))
+    
+    def decode_chunk_json(self, json_data: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Decode JSON data into a chunk object without building a UIMessageChunk.
+        
+        Args:
+            json_data: JSON string or bytes representing chunk data
+            
+        Returns:
+            Decoded JSON object, guaranteed to have a 'type' field
+            
+        Raises:
+            SSEParseError: If JSON is malformed or not an object with a type
+        """
         try:
-            data = json.loads(json_data)
-        except json.JSONDecodeError as e:
+            if self._simd_parser is not None:
+                data = self._parse_simdjson(json_data)
+            else:
+                data = _json_loads(json_data)
+        except ValueError as e:
             raise SSEParseError(f"Invalid JSON in chunk: {e}")
             
         if not isinstance(data, dict) or 'type' not in data:
             raise SSEParseError("Chunk must be a JSON object with 'type' field")
+        return data
+    
+    def chunk_from_dict(self, data: Dict[str, Any]) -> UIMessageChunk:
+        """
+        Build a UIMessageChunk from a decoded chunk object.
+        
+        Args:
+            data: Object returned by decode_chunk_json
             
+        Returns:
+            UIMessageChunk object
+            
+        Raises:
+            SSEParseError: If the chunk type is unknown or its fields are invalid
+        """
         chunk_type = data['type']
         
-        # Map chunk types to their corresponding classes
-        chunk_classes = {
-            'text-start': TextStartChunk,
-            'text-delta': TextDeltaChunk,
-            'text-end': TextEndChunk,
-            'reasoning-start': ReasoningStartChunk,
-            'reasoning-delta': ReasoningDeltaChunk,
-            'reasoning-end': ReasoningEndChunk,
-            'tool-input-start': ToolInputStartChunk,
-            'tool-input-delta': ToolInputDeltaChunk,
-            'tool-input-available': ToolInputAvailableChunk,
-            'tool-input-error': ToolInputErrorChunk,
-            'tool-output-available': ToolOutputAvailableChunk,
-            'tool-output-error': ToolOutputErrorChunk,
-            'source-url': SourceUrlChunk,
-            'source-document': SourceDocumentChunk,
-            'file': FileChunk,
-            'start-step': StepStartChunk,
-            'finish-step': StepFinishChunk,
-            'message-metadata': MessageMetadataChunk,
-            'error': ErrorChunk,
-            'start': StartChunk,
-            'finish': FinishChunk,
-            'abort': AbortChunk,
-        }
-        
-        # Add custom chunk types
-        chunk_classes.update(self.chunk_factory)
-        
         # Handle data chunks (data-*)
         if chunk_type.startswith('data-'):
             return DataChunk(
@@ -136,14 +363,13 @@ class SSEParser:
                 providerMetadata=data.get('providerMetadata')
             )
 
-        chunk_class = chunk_classes.get(chunk_type)
-        if not chunk_class:
+        factory = self._chunk_factories.get(chunk_type)
+        if factory is None:
             raise SSEParseError(f"Unknown chunk type: {chunk_type}")
         
         try:
-            # Use data directly since Python implementation now matches TypeScript field names
-            return chunk_class(**data)
-        except TypeError as e:
+            return factory(data)
+        except (TypeError, KeyError) as e:
             raise SSEParseError(f"Failed to create {chunk_type} chunk: {e}")
     
     def parse_sse_stream(self, stream_lines: Iterator[str] | Iterator[bytes]) -> Iterator[UIMessageChunk]:
@@ -151,7 +377,7 @@ class SSEParser:
         Parse an SSE stream and yield UIMessageChunk objects.
         
         Args:
-            stream_lines: Iterator of raw SSE lines
+            stream_lines: Iterator of raw SSE lines, either all str or all bytes
             
         Yields:
             UIMessageChunk objects parsed from the stream
@@ -159,16 +385,101 @@ class SSEParser:
         Raises:
             SSEParseError: If parsing fails
         """
-        for line in stream_lines:
-            event = self.parse_sse_line(str(line))
-            if event and event.data:
-                # Check for [DONE] marker
-                if event.data.strip() == '[DONE]':
-                    break
-                    
-                chunk = self.parse_chunk_json(event.data)
-                if chunk:
-                    yield chunk
+        # The line type is checked once, on the first line, and the stream is
+        # handed to a loop specialized for it
+        stream_lines = iter(stream_lines)
+        first = next(stream_lines, None)
+        if first is None:
+            return
+        lines = chain((first,), stream_lines)
+        if isinstance(first, str):
+            yield from self._parse_lines_str(lines)
+        else:
+            yield from self._parse_lines_bytes(lines)
+    
+    def _parse_lines_str(self, lines: Iterator[str]) -> Iterator[UIMessageChunk]:
+        """Parse str lines; the inlined counterpart of parse_sse_line."""
+        parse_chunk_json = self.parse_chunk_json
+        for line in lines:
+            if line.startswith('data:'):
+                data = line[5:].strip()
+                if data:
+                    # Check for [DONE] marker
+                    if data == '[DONE]':
+                        break
+                    # parse_chunk_json either returns a chunk or raises
+                    yield parse_chunk_json(data)
+    
+    def _parse_lines_bytes(self, lines: Iterator[bytes]) -> Iterator[UIMessageChunk]:
+        """Parse bytes lines, passing data undecoded; orjson parses bytes directly."""
+        parse_chunk_json = self.parse_chunk_json
+        for line in lines:
+            if line.startswith(b'data:'):
+                data = line[5:].strip()
+                if data:
+                    # Check for [DONE] marker
+                    if data == b'[DONE]':
+                        break
+                    # parse_chunk_json either returns a chunk or raises
+                    yield parse_chunk_json(data)
+    
+    def parse_sse_bytes(self, data_chunks: Iterable[bytes]) -> Iterator[UIMessageChunk]:
+        """
+        Parse raw transport reads and yield UIMessageChunk objects.
+        
+        Unlike parse_sse_stream, the items need not be complete lines: reads
+        are buffered by feed(), so lines and events may be split anywhere.
+        
+        Args:
+            data_chunks: Iterable of raw bytes as received from the transport
+            
+        Yields:
+            UIMessageChunk objects parsed from the stream
+            
+        Raises:
+            SSEParseError: If parsing fails
+        """
+        for data in data_chunks:
+            for payload in self.feed(data):
+                if not payload:
+                    # Events with an empty data field carry no chunk
+                    continue
+                if payload == b'[DONE]':
+                    return
+                yield self.parse_chunk_json(payload)
+        # The stream may end without a blank line after its last event
+        payload = self.flush()
+        if payload and payload != b'[DONE]':
+            yield self.parse_chunk_json(payload)
+    
+    async def aparse_sse_bytes(self, data_chunks: AsyncIterable[bytes]) -> AsyncIterator[UIMessageChunk]:
+        """
+        Async variant of parse_sse_bytes for async HTTP clients.
+        
+        Each read is parsed synchronously, so there is one await per read
+        rather than per line or event.
+        
+        Args:
+            data_chunks: Async iterable of raw bytes as received from the transport
+            
+        Yields:
+            UIMessageChunk objects parsed from the stream
+            
+        Raises:
+            SSEParseError: If parsing fails
+        """
+        async for data in data_chunks:
+            for payload in self.feed(data):
+                if not payload:
+                    # Events with an empty data field carry no chunk
+                    continue
+                if payload == b'[DONE]':
+                    return
+                yield self.parse_chunk_json(payload)
+        # The stream may end without a blank line after its last event
+        payload = self.flush()
+        if payload and payload != b'[DONE]':
+            yield self.parse_chunk_json(payload)
     
     def parse_sse_string(self, sse_data: str) -> List[UIMessageChunk]:
         """
@@ -30,6 +30,9 @@ class SSEStreamProcessor:
         """
         self.sse_parser = SSEParser(chunk_factory)
         self.message_processor = UIMessageStreamProcessor(message_id)
+        # Without custom chunk types, delta chunks are applied straight from
+        # the decoded JSON, skipping the intermediate chunk objects
+        self._fused = not chunk_factory
         
     def process_sse_line(self, line: str) -> Optional[UIMessage]:
         """
@@ -41,16 +44,16 @@ class SSEStreamProcessor:
         Returns:
             Complete UIMessage if stream ended, None if still processing
         """
-        event = self.sse_parser.parse_sse_line(line)
-        if event and event.data:
+        payload = self.sse_parser.parse_sse_line(line)
+        if payload:
             # Check for completion
-            if event.data.strip() == '[DONE]':
+            if self.sse_parser.is_done_marker(payload):
                 return self.message_processor.build_message()
                 
             try:
-                chunk = self.sse_parser.parse_chunk_json(event.data)
-                if chunk:
-                    self.message_processor.process_chunk(chunk)
+                data = self.sse_parser.decode_chunk_json(payload)
+                if not (self._fused and self.message_processor.process_json_dict(data)):
+                    self.message_processor.process_chunk(self.sse_parser.chunk_from_dict(data))
             except SSEParseError:
                 pass  # Skip malformed chunks
                 
@@ -89,6 +92,20 @@ def sse_stream_to_message(
         >>> message = sse_stream_to_message(sse_data)
         >>> message.parts[0].text  # "Hello world"
     """
-    chunks = parse_sse_to_chunks(sse_stream, chunk_factory)
     processor = UIMessageStreamProcessor(message_id)
-    return processor.process_stream(chunks), processor
\ No newline at end of file
+    if chunk_factory:
+        chunks = parse_sse_to_chunks(sse_stream, chunk_factory)
+        return processor.process_stream(chunks), processor
+    
+    # Delta chunks are applied straight from the decoded JSON
+    parser = SSEParser()
+    lines = sse_stream.split('\n') if isinstance(sse_stream, str) else sse_stream
+    for line in lines:
+        payload = parser.parse_sse_line(line)
+        if payload:
+            if parser.is_done_marker(payload):
+                break
+            data = parser.decode_chunk_json(payload)
+            if not processor.process_json_dict(data):
+                processor.process_chunk(parser.chunk_from_dict(data))
+    return processor.build_message(), processor
\ No newline at end of file
@@ -5,9 +5,10 @@ This module contains the core functionality for processing streaming message chu
 and building complete UIMessage objects from accumulated streaming data.
 """
 
-from typing import Dict, List, Optional, Iterator, Any, Literal, Union
+from typing import Dict, List, Optional, Iterable, Iterator, Any, Literal, Union
 from dataclasses import dataclass, field
-import uuid
+import binascii
+import secrets
 
 from .UIMessageChunk import (
     UIMessageChunk, TextStartChunk, TextDeltaChunk, TextEndChunk,
@@ -25,7 +26,7 @@ from .UIMessage import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Internal representation of a tool call during streaming."""
     id: str = ""
@@ -35,25 +36,34 @@ class ToolCall:
     dynamic: bool = False
     provider_executed: Optional[bool] = None
     preliminary: Optional[bool] = None
-    input_text: str = ""
+    # Streamed input text deltas, joined on demand by input_text
+    input_text_parts: List[str] = field(default_factory=list)
     input_error: Optional[str] = None
     output_error: Optional[str] = None
+    # Index of the tool's UI part in completed_parts, once it has been added
+    part_index: Optional[int] = None
 
+    @property
+    def input_text(self) -> str:
+        """Input text streamed so far."""
+        return ''.join(self.input_text_parts)
 
-@dataclass
+
+@dataclass(slots=True)
 class StreamState:
     """Internal state for tracking streaming message construction."""
     message_id: str = ""
     role: Role = "assistant"
     metadata: Optional[Any] = None
     
-    # Current text part being streamed
-    current_text_content: str = ""
-    text_active: bool = False
+    # Text parts being streamed, keyed by part id. Deltas are kept as lists and
+    # joined on demand; provider metadata is held in a parallel mapping.
+    text_buffers: Dict[str, List[str]] = field(default_factory=dict)
+    text_metadata: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
     
-    # Current reasoning part being streamed
-    current_reasoning_content: str = ""
-    reasoning_active: bool = False
+    # Reasoning parts being streamed, keyed by part id
+    reasoning_buffers: Dict[str, List[str]] = field(default_factory=dict)
+    reasoning_metadata: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
     
     # Tool calls tracking
     tool_calls: Dict[str, ToolCall] = field(default_factory=dict)
@@ -65,6 +75,43 @@ class StreamState:
     error_text: Optional[str] = None
 
 
+# Built-in chunk class -> name of the UIMessageStreamProcessor method handling it.
+# Chunks of other classes are dispatched by type; 'data-*' types by prefix.
+_HANDLER_NAMES = {
+    TextStartChunk: '_handle_text_start',
+    TextDeltaChunk: '_handle_text_delta',
+    TextEndChunk: '_handle_text_end',
+    ReasoningStartChunk: '_handle_reasoning_start',
+    ReasoningDeltaChunk: '_handle_reasoning_delta',
+    ReasoningEndChunk: '_handle_reasoning_end',
+    ToolInputStartChunk: '_handle_tool_input_start',
+    ToolInputDeltaChunk: '_handle_tool_input_delta',
+    ToolInputAvailableChunk: '_handle_tool_input_available',
+    ToolInputErrorChunk: '_handle_tool_input_error',
+    ToolOutputAvailableChunk: '_handle_tool_output_available',
+    ToolOutputErrorChunk: '_handle_tool_output_error',
+    SourceUrlChunk: '_handle_source_url',
+    SourceDocumentChunk: '_handle_source_document',
+    FileChunk: '_handle_file',
+    StepStartChunk: '_handle_step_start',
+    StepFinishChunk: '_handle_step_finish',
+    MessageMetadataChunk: '_handle_message_metadata',
+    DataChunk: '_handle_data',
+    ErrorChunk: '_handle_error',
+    StartChunk: '_handle_start',
+    FinishChunk: '_handle_finish',
+    AbortChunk: '_handle_abort',
+}
+
+# Chunk type -> names of its chunk handler and of the handler of its decoded
+# JSON object, for the chunk types process_json_dict applies directly
+_JSON_HANDLER_NAMES = {
+    'text-delta': ('_handle_text_delta', '_handle_text_delta_json'),
+    'reasoning-delta': ('_handle_reasoning_delta', '_handle_reasoning_delta_json'),
+    'tool-input-delta': ('_handle_tool_input_delta', '_handle_tool_input_delta_json'),
+}
+
+
 class UIMessageStreamProcessor:
     """
     Processes UIMessageChunk streams to build complete UIMessage objects.
@@ -73,6 +120,42 @@ class UIMessageStreamProcessor:
     the final message once streaming is complete or when requested.
     """
     
+    # Handler tables built from _HANDLER_NAMES by _build_dispatch
+    _DISPATCH: Dict[type, Any]
+    _DISPATCH_BY_TYPE: Dict[str, Any]
+    _JSON_DISPATCH: Dict[str, Any]
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Pick up handlers overridden by the subclass
+        cls._build_dispatch()
+    
+    @classmethod
+    def _build_dispatch(cls):
+        """
+        Build the handler tables of cls from its (possibly overridden) methods.
+        
+        Handlers are stored as plain functions and called as handler(self, chunk),
+        so processors hold no bound methods that would reference themselves.
+        """
+        cls._DISPATCH = {
+            chunk_class: getattr(cls, name) for chunk_class, name in _HANDLER_NAMES.items()
+        }
+        # Chunks of other classes, e.g. custom ones from a chunk_factory, are
+        # dispatched by the type of the built-in class they stand in for
+        cls._DISPATCH_BY_TYPE = {
+            chunk_class.__dataclass_fields__['type'].default: handler
+            for chunk_class, handler in cls._DISPATCH.items()
+            if chunk_class is not DataChunk
+        }
+        # Decoded chunks bypass the chunk handlers, so a type is only handled by
+        # process_json_dict while its chunk handler is not overridden
+        cls._JSON_DISPATCH = {
+            chunk_type: getattr(cls, json_name)
+            for chunk_type, (name, json_name) in _JSON_HANDLER_NAMES.items()
+            if getattr(cls, name) is getattr(UIMessageStreamProcessor, name)
+        }
+    
     def __init__(self, default_message_id: Optional[str] = None):
         """
         Initialize the stream processor.
@@ -80,14 +163,15 @@ class UIMessageStreamProcessor:
         Args:
             default_message_id: Optional default message ID to use if not provided in chunks
         """
-        self.default_message_id = default_message_id or str(uuid.uuid4())
+        # A random id is only generated if no id is known when a message is built
+        self.default_message_id = default_message_id
         self.state = StreamState()
         self.reset()
     
     def reset(self):
         """Reset the processor state for a new message."""
         self.state = StreamState()
-        self.state.message_id = self.default_message_id
+        self.state.message_id = self.default_message_id or ""
     
     def _create_tool_ui_part(self, tool_call: ToolCall) -> Union[ToolUIPart, DynamicToolUIPart]:
         """Create appropriate UI part from a completed tool call."""
@@ -135,55 +219,88 @@ class UIMessageStreamProcessor:
         Returns:
             Complete UIMessage if stream ended, None if still streaming
         """
-        if isinstance(chunk, TextStartChunk):
-            self._handle_text_start(chunk)
-        elif isinstance(chunk, TextDeltaChunk):
-            self._handle_text_delta(chunk)
-        elif isinstance(chunk, TextEndChunk):
-            self._handle_text_end(chunk)
-        elif isinstance(chunk, ReasoningStartChunk):
-            self._handle_reasoning_start(chunk)
-        elif isinstance(chunk, ReasoningDeltaChunk):
-            self._handle_reasoning_delta(chunk)
-        elif isinstance(chunk, ReasoningEndChunk):
-            self._handle_reasoning_end(chunk)
-        elif isinstance(chunk, ToolInputStartChunk):
-            self._handle_tool_input_start(chunk)
-        elif isinstance(chunk, ToolInputDeltaChunk):
-            self._handle_tool_input_delta(chunk)
-        elif isinstance(chunk, ToolInputAvailableChunk):
-            self._handle_tool_input_available(chunk)
-        elif isinstance(chunk, ToolInputErrorChunk):
-            self._handle_tool_input_error(chunk)
-        elif isinstance(chunk, ToolOutputAvailableChunk):
-            self._handle_tool_output_available(chunk)
-        elif isinstance(chunk, ToolOutputErrorChunk):
-            self._handle_tool_output_error(chunk)
-        elif isinstance(chunk, SourceUrlChunk):
-            self._handle_source_url(chunk)
-        elif isinstance(chunk, SourceDocumentChunk):
-            self._handle_source_document(chunk)
-        elif isinstance(chunk, FileChunk):
-            self._handle_file(chunk)
-        elif isinstance(chunk, StepStartChunk):
-            self._handle_step_start(chunk)
-        elif isinstance(chunk, StepFinishChunk):
-            self._handle_step_finish(chunk)
-        elif isinstance(chunk, MessageMetadataChunk):
-            self._handle_message_metadata(chunk)
-        elif isinstance(chunk, DataChunk):
-            self._handle_data(chunk)
-        elif isinstance(chunk, ErrorChunk):
-            self._handle_error(chunk)
-        elif isinstance(chunk, StartChunk):
-            self._handle_start(chunk)
-        elif isinstance(chunk, FinishChunk):
-            self._handle_finish(chunk)
-        elif isinstance(chunk, AbortChunk):
-            self._handle_abort(chunk)
+        handler = self._DISPATCH.get(type(chunk))
+        if handler is not None:
+            handler(self, chunk)
+        else:
+            self._dispatch_by_type(chunk)
         
         return None  # Return None while streaming, use build_message() to get final result
     
+    def process_chunks(self, chunks: Iterable[UIMessageChunk]) -> None:
+        """
+        Process a batch of chunks in a single loop.
+        
+        Equivalent to calling process_chunk for each chunk, without the
+        per-call overhead, so callers can hand over everything parsed from
+        one network read at once.
+        
+        Args:
+            chunks: Iterable of UIMessageChunk objects
+        """
+        dispatch = self._DISPATCH
+        for chunk in chunks:
+            handler = dispatch.get(type(chunk))
+            if handler is not None:
+                handler(self, chunk)
+            else:
+                self._dispatch_by_type(chunk)
+    
+    def process_json_dict(self, data: Dict[str, Any]) -> bool:
+        """
+        Process a decoded chunk object without building a UIMessageChunk.
+        
+        Only the delta chunk types, which make up most of a stream, are applied
+        directly; for any other type the caller must build the chunk and pass
+        it to process_chunk.
+        
+        Args:
+            data: Decoded JSON object of a chunk; it is not modified
+            
+        Returns:
+            True if the chunk was processed, False otherwise
+        """
+        handler = self._JSON_DISPATCH.get(data['type'])
+        if handler is None:
+            return False
+        handler(self, data)
+        return True
+    
+    def _handle_text_delta_json(self, data: Dict[str, Any]):
+        """Handle a decoded text delta chunk."""
+        self._append_delta(self.state.text_buffers, data.get('id', ''), data.get('delta', ''))
+    
+    def _handle_reasoning_delta_json(self, data: Dict[str, Any]):
+        """Handle a decoded reasoning delta chunk."""
+        self._append_delta(self.state.reasoning_buffers, data.get('id', ''), data.get('delta', ''))
+    
+    def _handle_tool_input_delta_json(self, data: Dict[str, Any]):
+        """Handle a decoded tool input delta chunk."""
+        self._append_tool_input(data.get('toolCallId', ''), data.get('inputTextDelta', ''))
+    
+    @staticmethod
+    def _append_delta(buffers: Dict[str, List[str]], part_id: str, delta: str):
+        """Append a text or reasoning delta to the buffer of its part."""
+        try:
+            buffers[part_id].append(delta)
+        except KeyError:
+            # Tolerate deltas that arrive without a start chunk
+            buffers[part_id] = [delta]
+    
+    def _append_tool_input(self, tool_call_id: str, delta: str):
+        """Append a tool input delta to its tool call, if the call was started."""
+        tool_call = self.state.tool_calls.get(tool_call_id)
+        if tool_call is not None:
+            tool_call.input_text_parts.append(delta)
+    
+    def _dispatch_by_type(self, chunk: UIMessageChunk):
+        """Dispatch a chunk of a class without a handler of its own by its type string."""
+        handler = self._DISPATCH_BY_TYPE.get(chunk.type)
+        if handler is not None:
+            handler(self, chunk)
+        elif chunk.type.startswith('data-'):
+            self._handle_data(chunk)
+    
     def process_stream(self, chunks: Iterator[UIMessageChunk]) -> UIMessage:
         """
         Process an entire stream of chunks and return the final message.
@@ -194,8 +311,7 @@ class UIMessageStreamProcessor:
         Returns:
             Complete UIMessage built from all chunks
         """
-        for chunk in chunks:
-            self.process_chunk(chunk)
+        self.process_chunks(chunks)
         return self.build_message()
     
     def build_message(self) -> UIMessage:
@@ -205,23 +321,46 @@ class UIMessageStreamProcessor:
         Returns:
             Complete UIMessage object
         """
-        parts = []
+        state = self.state
         
-        # Add any currently active text content
-        if self.state.current_text_content and self.state.text_active:
-            parts.append(TextUIPart(text=self.state.current_text_content, state='streaming'))
-        
-        # Add any currently active reasoning content
-        if self.state.current_reasoning_content and self.state.reasoning_active:
-            parts.append(ReasoningUIPart(text=self.state.current_reasoning_content, state='streaming'))
-        
-        # Add all completed parts (including completed text/reasoning parts and tools)
-        parts.extend(self.state.completed_parts)
+        if not state.text_buffers and not state.reasoning_buffers:
+            # Finished stream: the parts are the completed ones, copied in one
+            # allocation of the exact size
+            parts = state.completed_parts.copy()
+        else:
+            parts = []
+            
+            # Add any currently active text content
+            for part_id, buffer in state.text_buffers.items():
+                text = ''.join(buffer)
+                if text:
+                    parts.append(TextUIPart(
+                        text=text,
+                        state='streaming',
+                        providerMetadata=state.text_metadata.get(part_id)
+                    ))
+            
+            # Add any currently active reasoning content
+            for part_id, buffer in state.reasoning_buffers.items():
+                text = ''.join(buffer)
+                if text:
+                    parts.append(ReasoningUIPart(
+                        text=text,
+                        state='streaming',
+                        providerMetadata=state.reasoning_metadata.get(part_id)
+                    ))
+            
+            # Add all completed parts (including completed text/reasoning parts and tools)
+            parts.extend(state.completed_parts)
         
         # Handle error case
-        if self.state.error_text:
+        if state.error_text:
             # Add error as text part for now
-            parts.append(TextUIPart(text=f"Error: {self.state.error_text}"))
+            parts.append(TextUIPart(text=f"Error: {state.error_text}"))
+        
+        if not state.message_id:
+            # Kept in the state so repeated builds return the same id
+            state.message_id = secrets.token_hex(8)
         
         return UIMessage(
             id=self.state.message_id,
@@ -234,51 +373,59 @@ class UIMessageStreamProcessor:
     
     def _handle_text_start(self, chunk: TextStartChunk):
         """Handle text start chunk."""
-        self.state.text_active = True
-        self.state.current_text_content = ""
+        self.state.text_buffers[chunk.id] = []
+        self.state.text_metadata[chunk.id] = chunk.providerMetadata
     
     def _handle_text_delta(self, chunk: TextDeltaChunk):
         """Handle text delta chunk."""
-        self.state.current_text_content += chunk.delta
+        self._append_delta(self.state.text_buffers, chunk.id, chunk.delta)
     
     def _handle_text_end(self, chunk: TextEndChunk):
         """Handle text end chunk."""
-        self.state.text_active = False
+        buffer = self.state.text_buffers.pop(chunk.id, None)
+        metadata = self.state.text_metadata.pop(chunk.id, None)
         # Add completed text part if there's content
-        if self.state.current_text_content:
-            self.state.completed_parts.append(TextUIPart(text=self.state.current_text_content, state='done'))
-            self.state.current_text_content = ""
+        text = ''.join(buffer) if buffer else ''
+        if text:
+            self.state.completed_parts.append(TextUIPart(
+                text=text,
+                state='done',
+                providerMetadata=chunk.providerMetadata or metadata
+            ))
     
     def _handle_reasoning_start(self, chunk: ReasoningStartChunk):
         """Handle reasoning start chunk."""
-        self.state.reasoning_active = True
-        self.state.current_reasoning_content = ""
+        self.state.reasoning_buffers[chunk.id] = []
+        self.state.reasoning_metadata[chunk.id] = chunk.providerMetadata
     
     def _handle_reasoning_delta(self, chunk: ReasoningDeltaChunk):
         """Handle reasoning delta chunk."""
-        self.state.current_reasoning_content += chunk.delta
+        self._append_delta(self.state.reasoning_buffers, chunk.id, chunk.delta)
     
     def _handle_reasoning_end(self, chunk: ReasoningEndChunk):
         """Handle reasoning end chunk."""
-        self.state.reasoning_active = False
+        buffer = self.state.reasoning_buffers.pop(chunk.id, None)
+        metadata = self.state.reasoning_metadata.pop(chunk.id, None)
         # Add completed reasoning part if there's content
-        if self.state.current_reasoning_content:
-            self.state.completed_parts.append(ReasoningUIPart(text=self.state.current_reasoning_content, state='done'))
-            self.state.current_reasoning_content = ""
+        text = ''.join(buffer) if buffer else ''
+        if text:
+            self.state.completed_parts.append(ReasoningUIPart(
+                text=text,
+                state='done',
+                providerMetadata=chunk.providerMetadata or metadata
+            ))
     
     def _handle_tool_input_start(self, chunk: ToolInputStartChunk):
         """Handle tool input start chunk."""
         self.state.tool_calls[chunk.toolCallId] = ToolCall(
             id=chunk.toolCallId,
             name=chunk.toolName,
-            dynamic=chunk.dynamic or False,
-            input_text=''
+            dynamic=chunk.dynamic or False
         )
     
     def _handle_tool_input_delta(self, chunk: ToolInputDeltaChunk):
         """Handle tool input delta chunk."""
-        if chunk.toolCallId in self.state.tool_calls:
-            self.state.tool_calls[chunk.toolCallId].input_text += chunk.inputTextDelta
+        self._append_tool_input(chunk.toolCallId, chunk.inputTextDelta)
     
     def _handle_tool_input_available(self, chunk: ToolInputAvailableChunk):
         """Handle tool input available chunk."""
@@ -298,8 +445,7 @@ class UIMessageStreamProcessor:
             tool_call = self.state.tool_calls[chunk.toolCallId]
             tool_call.input_error = chunk.errorText
             # Tool is complete when input error occurs - add to completed parts
-            if tool_call.name and tool_call.args is not None:
-                self.state.completed_parts.append(self._create_tool_ui_part(tool_call))
+            self._finalize_tool(tool_call)
     
     def _handle_tool_output_available(self, chunk: ToolOutputAvailableChunk):
         """Handle tool output available chunk."""
@@ -308,8 +454,7 @@ class UIMessageStreamProcessor:
             tool_call.result = chunk.output
             tool_call.preliminary = chunk.preliminary
             # Tool is complete when output is available - add to completed parts
-            if tool_call.name and tool_call.args is not None:
-                self.state.completed_parts.append(self._create_tool_ui_part(tool_call))
+            self._finalize_tool(tool_call)
     
     def _handle_tool_output_error(self, chunk: ToolOutputErrorChunk):
         """Handle tool output error chunk."""
@@ -317,8 +462,23 @@ class UIMessageStreamProcessor:
             tool_call = self.state.tool_calls[chunk.toolCallId]
             tool_call.output_error = chunk.errorText
             # Tool is complete when output error occurs - add to completed parts
-            if tool_call.name and tool_call.args is not None:
-                self.state.completed_parts.append(self._create_tool_ui_part(tool_call))
+            self._finalize_tool(tool_call)
+    
+    def _finalize_tool(self, tool_call: ToolCall):
+        """
+        Add the UI part of a tool call that has reached a terminal state.
+        
+        A tool call gets a single part: later terminal chunks for the same
+        call, e.g. the final output after a preliminary one, replace it.
+        """
+        if not tool_call.name or tool_call.args is None:
+            return
+        part = self._create_tool_ui_part(tool_call)
+        if tool_call.part_index is None:
+            tool_call.part_index = len(self.state.completed_parts)
+            self.state.completed_parts.append(part)
+        else:
+            self.state.completed_parts[tool_call.part_index] = part
     
     def _handle_source_url(self, chunk: SourceUrlChunk):
         """Handle source URL chunk."""
@@ -338,10 +498,14 @@ class UIMessageStreamProcessor:
     
     def _handle_file(self, chunk: FileChunk):
         """Handle file chunk."""
+        data = chunk.data
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = binascii.b2a_base64(data, newline=False).decode('ascii')
+        # Otherwise data was decoded from JSON and is already base64 text
         self.state.completed_parts.append(FileUIPart(
             mediaType=chunk.contentType,
             filename=chunk.filename,
-            url=f"data:{chunk.contentType};base64,{chunk.data.hex()}"
+            url=f"data:{chunk.contentType};base64,{data}"
         ))
     
     def _handle_step_start(self, chunk: StepStartChunk):
@@ -380,6 +544,9 @@ class UIMessageStreamProcessor:
         self.state.error_text = "Generation was aborted"
 
 
+UIMessageStreamProcessor._build_dispatch()
+
+
 class StreamBuffer:
     """
     Buffer for collecting chunks before processing.
@@ -414,8 +581,9 @@ class StreamBuffer:
     
     def get_chunks(self) -> List[UIMessageChunk]:
         """Get all buffered chunks and clear the buffer."""
-        buffered_chunks = self.chunks.copy()
-        self.chunks.clear()
+        # Hand over the list itself rather than a copy of it
+        buffered_chunks = self.chunks
+        self.chunks = []
         return buffered_chunks
     
     def process_with(self, processor: UIMessageStreamProcessor) -> UIMessage:
@@ -428,8 +596,7 @@ class StreamBuffer:
         Returns:
             UIMessage built from buffered chunks
         """
-        for chunk in self.chunks:
-            processor.process_chunk(chunk)
+        processor.process_chunks(self.chunks)
         return processor.build_message()
 
 